@@ -17,14 +17,18 @@ MangaDex information source
 from __future__ import annotations
 
 import argparse
+import collections
+import concurrent.futures
 import datetime
+import itertools
 import json
 import logging
 import pathlib
+import threading
 import time
-from typing import Any, Callable, Generic, TypeVar
+from typing import Any, Callable, Generic, Iterator, TypeVar
 from typing_extensions import TypedDict
-from urllib.parse import urljoin
+from urllib.parse import urlencode, urljoin
 
 import comictalker.talker_utils as talker_utils
 import requests
@@ -36,7 +40,19 @@ from comictalker.comiccacher import ComicCacher
 from comictalker.comiccacher import Issue as CCIssue
 from comictalker.comiccacher import Series as CCSeries
 from comictalker.comictalker import ComicTalker, TalkerDataError, TalkerNetworkError
-from pyrate_limiter import Duration, Limiter, RequestRate
+from pyrate_limiter import AbstractBucket, Duration, Limiter, RequestRate
+from requests.adapters import HTTPAdapter
+
+try:
+    # orjson is much faster at (de)serialising responses and cached records but is not shipped with ComicTagger
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads  # type: ignore[assignment]
+
+    def json_dumps(obj: Any) -> bytes:  # type: ignore[misc]
+        return json.dumps(obj).encode("utf-8")
+
 
 logger = logging.getLogger(f"comictalker.{__name__}")
 
@@ -174,8 +190,125 @@ class MangaDexResponse(TypedDict, Generic[T], total=False):
     total: int
 
 
+class MangaDexSeriesContext(TypedDict):
+    """Series derived metadata shared by every chapter of a series"""
+
+    series_id: str | None
+    series: str | None
+    description: str | None
+    genres: set[str]
+    tags: set[str]
+    format: str | None
+    series_aliases: set[str]
+    maturity_rating: str | None
+    publisher: str | None
+    credits: list[tuple[str, str]]
+    issue_count: int | None
+    volume_count: int | None
+    year: int | None
+    web_link: str
+
+
+class _MemoryDequeBucket(AbstractBucket):
+    """In memory bucket that holds its lock for the whole of a limiter transaction so it can be used from several
+    threads. Expired items are dropped from the front so a deque avoids the list shuffling of MemoryListBucket."""
+
+    def __init__(self, maxsize: int = 0, **_kwargs: Any) -> None:
+        super().__init__(maxsize=maxsize)
+        self._q: collections.deque[float] = collections.deque()
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        return len(self._q)
+
+    def put(self, item: float) -> int:
+        if len(self._q) < self._maxsize:
+            self._q.append(item)
+            return 1
+        return 0
+
+    def get(self, number: int) -> int:
+        for _ in range(number):
+            self._q.popleft()
+        return number
+
+    def all_items(self) -> list[float]:
+        return list(self._q)
+
+    def flush(self) -> None:
+        self._q.clear()
+
+    def lock_acquire(self) -> None:
+        self._lock.acquire()
+
+    def lock_release(self) -> None:
+        self._lock.release()
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _LRUCache(Generic[K, V]):
+    """Thread safe mapping that drops the least recently used entry once maxsize entries are held"""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: collections.OrderedDict[K, V] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
 # MangaDex has a limit of 5 calls per second default (https://api.mangadex.org/docs/2-limitations/)
-limiter = Limiter(RequestRate(5, Duration.SECOND))
+limiter = Limiter(RequestRate(5, Duration.SECOND), bucket_class=_MemoryDequeBucket)
+# No point in having more page requests in flight than the limiter will allow per second
+max_workers = 5
+# Total size of the response bodies kept for conditional requests, bodies larger than the entry limit are not kept
+max_etag_cache_bytes = 4 * 1024 * 1024
+max_etag_entry_bytes = 512 * 1024
+# Number of decoded series records and derived series metadata kept, older entries are read from the cache again
+max_series_memo = 256
+# Content ratings and tag groups used to filter search results
+adult_ratings = frozenset(("erotica", "pornographic"))
+doujin_groups = frozenset(("genre", "format"))
+# Format tags used as the format, other format tags and these tag groups become tags
+format_tags = frozenset(("Web Comic", "Oneshot"))
+tag_groups = frozenset(("theme", "content"))
+# Maturity rating for each known content rating, anything else is capitalised
+content_ratings = {
+    "safe": "Safe",
+    "suggestive": "Suggestive",
+    "erotica": "Erotica",
+    "pornographic": "Pornographic",
+}
+# ComicCacher rewrites its version file when created, a parallel read of it can see it empty and clear the cache
+cacher_lock = threading.Lock()
+
+
+def pick_lang(texts: dict[str, str], pref: str = "en") -> str:
+    """Return the text in the preferred language, or the first one given if that language is missing"""
+    return texts.get(pref) or next(iter(texts.values()), "")
 
 
 class MangaDexTalker(ComicTalker):
@@ -197,6 +330,7 @@ class MangaDexTalker(ComicTalker):
         # Default settings
         self.default_api_url = self.api_url = "https://api.mangadex.org"
         self.cover_url_base = "https://uploads.mangadex.org/covers/"
+        self._title_url_prefix = self.website.rstrip("/") + "/title/"
 
         # Use same defaults as MangaDex
         self.adult_content: bool = False
@@ -207,6 +341,33 @@ class MangaDexTalker(ComicTalker):
         self.use_ongoing_issue_count: bool = False
         self.use_series_start_as_volume: bool = False
 
+        # Decoded series records, saves re-reading and decoding the cached record for every lookup
+        self._series_memo: _LRUCache[str, MangaDexSeries] = _LRUCache(max_series_memo)
+        # Series derived metadata by series ID along with the record it was built from
+        self._series_contexts: _LRUCache[str, tuple[MangaDexSeries, MangaDexSeriesContext]] = _LRUCache(max_series_memo)
+
+        # ETag and body of recent responses, repeated requests can then be answered with a 304 and no body
+        # Only used for requests ComicCacher does not already cover
+        self._etag_cache: dict[str, tuple[str, bytes]] = {}
+        self._etag_cache_bytes = 0
+        self._etag_cache_lock = threading.Lock()
+
+        # Share connections between requests, pages are fetched from several threads so allow for them in the pool
+        self._session = requests.Session()
+        self._session.headers["user-agent"] = "comictagger/" + self.version
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # __init__ may have failed before the session was created
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
     def register_settings(self, parser: settngs.Manager) -> None:
         parser.add_setting(
             "--mdex-exclude-doujin",
@@ -259,6 +420,9 @@ class MangaDexTalker(ComicTalker):
         self.use_volume_cover_matching = settings["mdex_volume_cover_matching"]
         self.use_volume_cover_window = settings["mdex_volume_cover_window"]
         self.use_ongoing_issue_count = settings["mdex_use_ongoing"]
+
+        self._series_memo.clear()
+        self._series_contexts.clear()
         return settings
 
     def check_status(self, settings: dict[str, Any]) -> tuple[str, bool]:
@@ -267,15 +431,13 @@ class MangaDexTalker(ComicTalker):
             url = self.default_api_url
         try:
             test_url = urljoin(url, "ping")
-            mdex_response = requests.get(
-                test_url,
-                headers={"user-agent": "comictagger/" + self.version},
-            )
+            # (connect, read) timeouts so a bad URL can't leave the settings window hanging
+            mdex_response = self._session.get(test_url, timeout=(3.0, 5.0))
 
-            if mdex_response.text != "pong":
+            if mdex_response.content != b"pong":
                 return "Failed to contact MangaDex API", False
             return "The API access test was successful", True
-        except Exception:
+        except requests.exceptions.RequestException:
             return "Failed to connect to the API! Incorrect URL?", False
 
     def search_for_series(
@@ -291,24 +453,21 @@ class MangaDexTalker(ComicTalker):
 
         # Before we search online, look in our cache, since we might have done this same search recently
         # For literal searches always retrieve from online
-        cvc = ComicCacher(self.cache_folder, self.version)
+        cvc = self._get_cacher()
         if not refresh_cache and not literal:
             cached_search_results = cvc.get_search_results(self.id, series_name)
             if len(cached_search_results) > 0:
                 # Unpack to apply any filters
-                json_cache: list[MangaDexSeries] = [json.loads(x[0].data) for x in cached_search_results]
-                if not self.adult_content:
-                    json_cache = self._filter_adult(json_cache)
-                if self.exclude_doujin:
-                    json_cache = self._filter_dojin(json_cache)
+                json_cache: list[MangaDexSeries] = [json_loads(x[0].data) for x in cached_search_results]
 
-                return self._format_search_results(json_cache)
+                return self._format_search_results(self._apply_filters(json_cache))
 
-        includes = ["cover_art", "artist", "author", "creator", "tag"]
+        includes = ["cover_art", "artist", "author", "tag"]
 
         # Add all for cache and filter after
         content_rating = ["safe", "suggestive", "erotica", "pornographic"]
 
+        search_url = urljoin(self.api_url, "manga")
         params = {
             "title": search_series_name,
             "includes[]": includes,
@@ -317,11 +476,9 @@ class MangaDexTalker(ComicTalker):
             "offset": 0,
         }
 
-        mdex_response: MangaDexResponse[list[MangaDexSeries]] = self._get_content(
-            urljoin(self.api_url, "manga"), params
-        )
-
-        search_results: list[MangaDexSeries] = []
+        # Only searches that skip the cache are repeated against the API
+        conditional = literal or refresh_cache
+        mdex_response: MangaDexResponse[list[MangaDexSeries]] = self._get_content(search_url, params, conditional)
 
         current_result_count = len(mdex_response["data"])
         total_result_count = mdex_response["total"]
@@ -334,50 +491,52 @@ class MangaDexTalker(ComicTalker):
 
         if callback is None:
             logger.debug(f"Found {current_result_count} of {total_result_count} results")
-        search_results.extend(mdex_response["data"])
-        offset = 0
+        pages = [mdex_response]
 
         if callback is not None:
             callback(len(mdex_response["data"]), total_result_count)
 
-        # see if we need to keep asking for more pages...
-        while current_result_count < total_result_count:
-            if not literal:
-                # Stop searching once any entry falls below the threshold
-                stop_searching = any(
-                    not utils.titles_match(search_series_name, series["attributes"]["title"]["en"], series_match_thresh)
-                    for series in mdex_response["data"]
-                )
-
-                if stop_searching:
-                    break
+        # Stop searching once any entry falls below the threshold
+        def stop_searching(page: list[MangaDexSeries]) -> bool:
+            return not literal and any(
+                not utils.titles_match(search_series_name, series["attributes"]["title"]["en"], series_match_thresh)
+                for series in page
+            )
 
+        # see if we need to keep asking for more pages...
+        if current_result_count < total_result_count and not stop_searching(mdex_response["data"]):
             if callback is None:
-                logger.debug(f"getting another page of results {offset * 100} of {total_result_count}...")
-            offset += 100
+                logger.debug(f"getting another {total_result_count - current_result_count} results...")
 
-            params["offset"] = offset
-            mdex_response = self._get_content(urljoin(self.api_url, "manga"), params)
+            # Without a literal search each page decides if the next is needed, so only then fetch them one at a time
+            for mdex_response in self._get_remaining_pages(
+                search_url, params, total_result_count, parallel=literal, conditional=conditional
+            ):
+                pages.append(mdex_response)
+                current_result_count += len(mdex_response["data"])
 
-            search_results.extend(mdex_response["data"])
-            current_result_count += len(mdex_response["data"])
+                if callback is not None:
+                    callback(current_result_count, total_result_count)
 
-            if callback is not None:
-                callback(current_result_count, total_result_count)
+                if stop_searching(mdex_response["data"]):
+                    break
+
+        search_results: list[MangaDexSeries] = self._combine_pages(pages)
 
         # Cache raw data. Includes credits data as it doesn't seem to increase API time.
         cvc.add_search_results(
             self.id,
             series_name,
-            [CCSeries(id=x["id"], data=json.dumps(x).encode("utf-8")) for x in search_results],
+            [CCSeries(id=x["id"], data=json_dumps(x)) for x in search_results],
             True,
         )
+        # The cache now has fresher records for these
+        for series in search_results:
+            self._series_memo.pop(series["id"])
+            self._series_contexts.pop(series["id"])
 
         # Apply any filters
-        if not self.adult_content:
-            search_results = self._filter_adult(search_results)
-        if self.exclude_doujin:
-            search_results = self._filter_dojin(search_results)
+        search_results = self._apply_filters(search_results)
 
         # Format result to ComicIssue
         formatted_search_results = self._format_search_results(search_results)
@@ -397,7 +556,7 @@ class MangaDexTalker(ComicTalker):
 
     def fetch_issues_in_series(self, series_id: str) -> list[GenericMetadata]:
         # before we search online, look in our cache, since we might already have this info
-        cvc = ComicCacher(self.cache_folder, self.version)
+        cvc = self._get_cacher()
         cached_series_issues_result = cvc.get_series_issues_info(series_id, self.id)
 
         series_data: MangaDexSeries = self._fetch_series(series_id)
@@ -405,7 +564,7 @@ class MangaDexTalker(ComicTalker):
         # A better way to check validity of cache number? Even with dedupe it is possible there is a n.5 chapter
         if len(cached_series_issues_result) > 0:
             return [
-                self._map_comic_issue_to_metadata(json.loads(x[0].data), series_data)
+                self._map_comic_issue_to_metadata(json_loads(x[0].data), series_data)
                 for x in cached_series_issues_result
             ]
 
@@ -413,33 +572,22 @@ class MangaDexTalker(ComicTalker):
         # Need to store all for cache and filter after
         content_rating = ["safe", "suggestive", "erotica", "pornographic"]
 
-        offset = 0
+        feed_url = urljoin(self.api_url, f"manga/{series_id}/feed/")
         # TODO For now, only English data
         params = {
             "includes[]": includes,
             "contentRating[]": content_rating,
             "translatedLanguage[]": "en",
             "limit": 100,
-            "offset": offset,
+            "offset": 0,
         }
 
-        mdex_response: MangaDexResponse[list[MangaDexChapter]] = self._get_content(
-            urljoin(self.api_url, f"manga/{series_id}/feed/"), params
-        )
-
-        current_result_count = len(mdex_response["data"])
-        total_result_count = mdex_response["total"]
-
-        series_issues_result: list[MangaDexChapter] = mdex_response["data"]
+        mdex_response: MangaDexResponse[list[MangaDexChapter]] = self._get_content(feed_url, params)
 
         # see if we need to keep asking for more pages...
-        while current_result_count < total_result_count:
-            offset += 100
-            params["offset"] = offset
-            mdex_response = self._get_content(urljoin(self.api_url, f"manga/{series_id}/feed/"), params)
-
-            series_issues_result.extend(mdex_response["data"])
-            current_result_count += len(mdex_response["data"])
+        series_issues_result: list[MangaDexChapter] = self._combine_pages(
+            [mdex_response, *self._get_remaining_pages(feed_url, params, mdex_response["total"])]
+        )
 
         # Dedupe the list
         series_issues_result = self._deupe_chapters(series_issues_result)
@@ -450,10 +598,7 @@ class MangaDexTalker(ComicTalker):
 
         cvc.add_issues_info(
             self.id,
-            [
-                CCIssue(id=str(x["id"]), series_id=series_id, data=json.dumps(x).encode("utf-8"))
-                for x in series_issues_result
-            ],
+            [CCIssue(id=str(x["id"]), series_id=series_id, data=json_dumps(x)) for x in series_issues_result],
             True,
         )
 
@@ -467,7 +612,6 @@ class MangaDexTalker(ComicTalker):
         self, series_id_list: list[str], issue_number: str, year: str | int | None
     ) -> list[GenericMetadata]:
         # year appears unreliable with publishAt so will ignore it (related to scanlation pub date?)
-        issues: list[GenericMetadata] = []
 
         # As this is not cached, can filter on the API. Should it be cached?
         content_rating = ["safe", "suggestive"]
@@ -475,7 +619,9 @@ class MangaDexTalker(ComicTalker):
             content_rating.append("erotica")
             content_rating.append("pornographic")
 
-        for series_id in series_id_list:
+        chapter_url = urljoin(self.api_url, "chapter")
+
+        def _fetch_one_series(series_id: str) -> list[GenericMetadata]:
             params = {
                 "manga": series_id,
                 "chapter": issue_number,
@@ -486,71 +632,138 @@ class MangaDexTalker(ComicTalker):
                 "offset": 0,
             }
 
-            mdex_response: MangaDexResponse[list[MangaDexChapter]] = self._get_content(
-                urljoin(self.api_url, "chapter"), params
-            )
-            series = self._fetch_series(series_id)
-
-            current_result_count = len(mdex_response["data"])
-            total_result_count = mdex_response["total"]
+            # Not cached so repeat lookups can use conditional requests
+            mdex_response: MangaDexResponse[list[MangaDexChapter]] = self._get_content(chapter_url, params, True)
 
-            issues_result: list[MangaDexChapter] = mdex_response["data"]
-
-            offset = 0
+            # No matching chapters so there is no need to look up the series or its covers
+            if not mdex_response["data"]:
+                return []
 
             # see if we need to keep asking for more pages...
-            while current_result_count < total_result_count:
-                offset += 100
-
-                params["offset"] = offset
-                mdex_response = self._get_content(urljoin(self.api_url, "chapter"), params)
-
-                current_result_count += len(mdex_response["data"])
-                issues_result.extend(mdex_response["data"])
+            # Already running in a worker so fetch them here rather than starting more threads
+            issues_result: list[MangaDexChapter] = self._combine_pages(
+                [
+                    mdex_response,
+                    *self._get_remaining_pages(
+                        chapter_url, params, mdex_response["total"], parallel=False, conditional=True
+                    ),
+                ]
+            )
 
             issues_result = self._deupe_chapters(issues_result)
 
             # Inject volume covers if required
             if self.use_volume_cover_matching or self.use_volume_cover_window:
-                issues_result = self._volume_covers(series_id, issues_result)
+                issues_result = self._volume_covers(series_id, issues_result, parallel=False)
 
-            for issue in issues_result:
-                issues.append(self._map_comic_issue_to_metadata(issue, series))
+            series = self._fetch_series(series_id)
+
+            return [self._map_comic_issue_to_metadata(issue, series) for issue in issues_result]
+
+        # Each series is independent, the limiter keeps the combined requests within the API limit
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                issues = list(itertools.chain.from_iterable(executor.map(_fetch_one_series, series_id_list)))
+            except Exception:
+                # Don't spend requests on the queued series when the lookup has already failed
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
         return issues
 
+    def _get_cacher(self) -> ComicCacher:
+        with cacher_lock:
+            return ComicCacher(self.cache_folder, self.version)
+
     @limiter.ratelimit("default", delay=True)
-    def _get_content(self, url: str, params: dict[str, Any]) -> MangaDexResponse:
-        mdex_response: MangaDexResponse = self._get_url_content(url, params)
+    def _get_content(self, url: str, params: dict[str, Any], conditional: bool = False) -> MangaDexResponse:
+        mdex_response: MangaDexResponse = self._get_url_content(url, params, conditional)
         if mdex_response.get("result") == "error":
             logger.debug(f"{self.name} query failed with error: {mdex_response['errors']}")
             raise TalkerNetworkError(self.name, 0, f"{mdex_response['errors']}")
 
         return mdex_response
 
-    def _get_url_content(self, url: str, params: dict[str, Any]) -> Any:
+    def _get_remaining_pages(
+        self, url: str, params: dict[str, Any], total: int, parallel: bool = True, conditional: bool = False
+    ) -> Iterator[MangaDexResponse]:
+        # Pages are yielded in order, when not parallel each one is only requested once the previous has been consumed
+        offsets = range(params["offset"] + params["limit"], total, params["limit"])
+        if not parallel or len(offsets) < 2:
+            for offset in offsets:
+                yield self._get_content(url, {**params, "offset": offset}, conditional)
+            return
+
+        # The first page gives the total so the rest can be requested together, the limiter will space them out
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(offsets), max_workers)) as executor:
+            yield from executor.map(
+                lambda offset: self._get_content(url, {**params, "offset": offset}, conditional), offsets
+            )
+
+    def _store_etag(self, cache_key: str, etag: str, body: bytes) -> None:
+        with self._etag_cache_lock:
+            old = self._etag_cache.pop(cache_key, None)
+            if old is not None:
+                self._etag_cache_bytes -= len(old[1])
+            if len(body) > max_etag_entry_bytes:
+                return
+
+            # Drop the oldest entries until the body fits
+            while self._etag_cache and self._etag_cache_bytes + len(body) > max_etag_cache_bytes:
+                self._etag_cache_bytes -= len(self._etag_cache.pop(next(iter(self._etag_cache)))[1])
+
+            self._etag_cache[cache_key] = (etag, body)
+            self._etag_cache_bytes += len(body)
+
+    def _combine_pages(self, pages: list[MangaDexResponse]) -> list[Any]:
+        # The total size is known up front so fill a list of that size instead of growing one page at a time
+        combined: list[Any] = [None] * sum(len(page["data"]) for page in pages)
+        offset = 0
+        for page in pages:
+            combined[offset : offset + len(page["data"])] = page["data"]
+            offset += len(page["data"])
+
+        return combined
+
+    def _get_url_content(self, url: str, params: dict[str, Any], conditional: bool = False) -> Any:
+        cache_key = ""
+        cached = None
+        if conditional:
+            cache_key = f"{url}?{urlencode(params, doseq=True)}"
+            with self._etag_cache_lock:
+                cached = self._etag_cache.get(cache_key)
+
+        headers = {}
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
         for tries in range(3):
             try:
-                resp = requests.get(url, params=params, headers={"user-agent": "comictagger/" + self.version})
+                resp = self._session.get(url, params=params, headers=headers)
 
                 if resp.status_code == requests.status_codes.codes.ok:
-                    return resp.json()
+                    if conditional and resp.headers.get("ETag"):
+                        self._store_etag(cache_key, resp.headers["ETag"], resp.content)
+                    return json_loads(resp.content)
+                # Decode the stored body again as callers are free to modify what they are given
+                if resp.status_code == requests.status_codes.codes.not_modified and cached is not None:
+                    return json_loads(cached[1])
                 if resp.status_code == requests.status_codes.codes.server_error:
                     logger.debug(f"Try #{tries + 1}: ")
                     time.sleep(1)
                     logger.debug(str(resp.status_code))
                 if resp.status_code == requests.status_codes.codes.bad_request:
-                    logger.debug(f"Bad request: {resp.json()}")
-                    raise TalkerNetworkError(self.name, 2, f"Bad request: {resp.json()}")
+                    logger.debug(f"Bad request: {resp.text}")
+                    raise TalkerNetworkError(self.name, 2, f"Bad request: {resp.text}")
                 if resp.status_code == requests.status_codes.codes.forbidden:
-                    logger.debug(f"Forbidden: {resp.json()}")
-                    raise TalkerNetworkError(self.name, 2, f"Forbidden: {resp.json()}")
+                    logger.debug(f"Forbidden: {resp.text}")
+                    raise TalkerNetworkError(self.name, 2, f"Forbidden: {resp.text}")
                 if resp.status_code == requests.status_codes.codes.not_found:
-                    logger.debug(f"Manga not found: {resp.json()}")
-                    raise TalkerNetworkError(self.name, 2, f"Manga not found: {resp.json()}")
+                    logger.debug(f"Manga not found: {resp.text}")
+                    raise TalkerNetworkError(self.name, 2, f"Manga not found: {resp.text}")
                 # Should never get here but in case something is changed with limits
                 if resp.status_code == requests.status_codes.codes.too_many_requests:
-                    logger.debug(f"Rate limit reached: {resp.json()}")
+                    logger.debug(f"Rate limit reached: {resp.text}")
                     # If given a time to wait before re-trying, use that time + 1
                     if resp.headers.get("x-ratelimit-retry-after", None):
                         wait_time = int(resp.headers["x-ratelimit-retry-after"]) - int(time.time())
@@ -577,27 +790,26 @@ class MangaDexTalker(ComicTalker):
     def _format_search_results(self, search_results: list[MangaDexSeries]) -> list[ComicSeries]:
         formatted_results = []
         for record in search_results:
-            alias_list = set()
-            for alias in record["attributes"]["altTitles"]:
-                for iso, title in alias.items():
-                    alias_list.add(title)
+            attrs = record["attributes"]
+            alias_list = {title for alias in attrs["altTitles"] for title in alias.values()}
 
             # TODO Use language preference?
             # "en" is not guaranteed
-            title = next(iter(record["attributes"]["title"].values()))
+            title = pick_lang(attrs["title"])
 
             # Publisher can only be gleaned from chapter information
             pub_name = ""
 
-            start_year = utils.xlate_int(record["attributes"].get("year"))
+            start_year = utils.xlate_int(attrs.get("year"))
 
             format_type = ""
-            for mdex_tags in record["attributes"]["tags"]:
+            for mdex_tags in attrs["tags"]:
                 if mdex_tags["attributes"]["group"] == "format":
                     format_type = mdex_tags["attributes"]["name"]["en"]
+                    break
 
             # TODO Use local language or setting etc.?
-            desc = record["attributes"]["description"].get("en", "")
+            desc = pick_lang(attrs["description"])
 
             image_url = ""
 
@@ -609,8 +821,8 @@ class MangaDexTalker(ComicTalker):
             formatted_results.append(
                 ComicSeries(
                     aliases=alias_list,
-                    count_of_issues=utils.xlate_int(record["attributes"].get("lastChapter", None)),
-                    count_of_volumes=utils.xlate_int(record["attributes"].get("lastVolume", None)),
+                    count_of_issues=utils.xlate_int(attrs.get("lastChapter", None)),
+                    count_of_volumes=utils.xlate_int(attrs.get("lastVolume", None)),
                     description=desc,
                     id=str(record["id"]),
                     image_url=image_url,
@@ -625,67 +837,71 @@ class MangaDexTalker(ComicTalker):
 
     def _deupe_chapters(self, chapters: list[MangaDexChapter]) -> list[MangaDexChapter]:
         # Because a chapter may have multiple release groups, dedupe with preference for "official" publisher
-        unique_chapters = {}
+        unique_chapters: dict[str, MangaDexChapter] = {}
 
-        for i, chapter in enumerate(chapters):
+        for chapter in chapters:
             chapter_number = chapter["attributes"]["chapter"]
-            is_official = False
-            for rel in chapter["relationships"]:
-                if rel.get("attributes") and rel["attributes"]["official"]:
-                    is_official = True
+            is_official = any((rel.get("attributes") or {}).get("official") for rel in chapter["relationships"])
 
-            # Check if the chapter number is already in the dictionary and replace with official if so
-            if chapter_number in unique_chapters and is_official:
-                unique_chapters[chapter_number] = i
-            else:
-                unique_chapters[chapter_number] = i
+            # Keep the first release of a chapter unless an official one comes along
+            if chapter_number not in unique_chapters or is_official:
+                unique_chapters[chapter_number] = chapter
 
-        dedupe_chapters = [chapter for i, chapter in enumerate(chapters) if i in unique_chapters.values()]
+        return list(unique_chapters.values())
 
-        return dedupe_chapters
-
-    def _filter_adult(self, series_results: list[MangaDexSeries]) -> list[MangaDexSeries]:
-        def is_adult(series):
+    def _apply_filters(self, series_results: list[MangaDexSeries]) -> list[MangaDexSeries]:
+        def is_adult(series: MangaDexSeries) -> bool:
             content_rating = series["attributes"]["contentRating"]
             tags = series["attributes"]["tags"]
 
-            return content_rating in ["erotica", "pornographic"] or any(
-                tag["attributes"]["group"] == "content" for tag in tags
-            )
+            return content_rating in adult_ratings or any(tag["attributes"]["group"] == "content" for tag in tags)
 
-        return [series for series in series_results if not is_adult(series)]
-
-    def _filter_dojin(self, series_results: list[MangaDexSeries]) -> list[MangaDexSeries]:
-        return [
-            series
-            for series in series_results
-            if not any(
-                tag["attributes"]["group"] in ["genre", "format"] and tag["attributes"]["name"]["en"] == "Doujinshi"
+        def is_doujin(series: MangaDexSeries) -> bool:
+            return any(
+                tag["attributes"]["group"] in doujin_groups and tag["attributes"]["name"]["en"] == "Doujinshi"
                 for tag in series["attributes"]["tags"]
             )
-        ]
+
+        # Only the enabled filters are checked, all in one pass over the results
+        exclude: list[Callable[[MangaDexSeries], bool]] = []
+        if not self.adult_content:
+            exclude.append(is_adult)
+        if self.exclude_doujin:
+            exclude.append(is_doujin)
+
+        if not exclude:
+            return series_results
+
+        return [series for series in series_results if not any(is_excluded(series) for is_excluded in exclude)]
 
     def fetch_series(self, series_id: str) -> ComicSeries:
         return self._format_search_results([self._fetch_series(series_id)])[0]
 
     def _fetch_series(self, series_id: str) -> MangaDexSeries:
+        memo = self._series_memo.get(series_id)
+        if memo is not None:
+            return memo
+
         # Search returns the full series information, this is a just in case
-        cvc = ComicCacher(self.cache_folder, self.version)
+        cvc = self._get_cacher()
         cached_series_result = cvc.get_series_info(series_id, self.id)
         if cached_series_result is not None:
-            return json.loads(cached_series_result[0].data)
+            series: MangaDexSeries = json_loads(cached_series_result[0].data)
+            self._series_memo.put(series_id, series)
+            return series
 
         # Include information for credits for use when tagging an issue
-        params = {"includes[]": ["cover_art", "author", "artist", "tag", "creator"]}
+        params = {"includes[]": ["cover_art", "author", "artist", "tag"]}
         series_url = urljoin(self.api_url, f"manga/{series_id}")
         mdex_response: MangaDexResponse[MangaDexSeries] = self._get_content(series_url, params)
 
         if mdex_response:
             cvc.add_series_info(
                 self.id,
-                CCSeries(id=str(mdex_response["data"]["id"]), data=json.dumps(mdex_response["data"]).encode("utf-8")),
+                CCSeries(id=str(mdex_response["data"]["id"]), data=json_dumps(mdex_response["data"])),
                 True,
             )
+            self._series_memo.put(series_id, mdex_response["data"])
 
         return mdex_response["data"]
 
@@ -695,7 +911,7 @@ class MangaDexTalker(ComicTalker):
         params = {"manga": series_id, "chapter": issue_number}
 
         issue_url = urljoin(self.api_url, "chapter")
-        mdex_response: MangaDexResponse[MangaDexChapter] = self._get_content(issue_url, params)
+        mdex_response: MangaDexResponse[MangaDexChapter] = self._get_content(issue_url, params, True)
 
         if mdex_response["data"]["id"]:
             return self._fetch_issue_data_by_issue_id(mdex_response["data"]["id"])
@@ -706,12 +922,12 @@ class MangaDexTalker(ComicTalker):
         # issue number presumed to be chapter number
         series_id = ""
 
-        cvc = ComicCacher(self.cache_folder, self.version)
+        cvc = self._get_cacher()
         cached_issues_result = cvc.get_issue_info(issue_id, self.id)
 
         if cached_issues_result and cached_issues_result[1]:
             return self._map_comic_issue_to_metadata(
-                json.loads(cached_issues_result[0].data), self._fetch_series(cached_issues_result[0].series_id)
+                json_loads(cached_issues_result[0].data), self._fetch_series(cached_issues_result[0].series_id)
             )
 
         # scanlation group wanted to try and glean publisher if "official" is True
@@ -734,7 +950,7 @@ class MangaDexTalker(ComicTalker):
                 CCIssue(
                     id=str(issue_result["id"]),
                     series_id=series_id,
-                    data=json.dumps(issue_result).encode("utf-8"),
+                    data=json_dumps(issue_result),
                 )
             ],
             True,
@@ -742,123 +958,163 @@ class MangaDexTalker(ComicTalker):
 
         return self._map_comic_issue_to_metadata(issue_result, series_result)
 
-    def _volume_covers(self, series_id: str, issues: list[MangaDexChapter]) -> list[MangaDexChapter]:
+    def _volume_covers(
+        self, series_id: str, issues: list[MangaDexChapter], parallel: bool = True
+    ) -> list[MangaDexChapter]:
         # As chapters do not have covers, fetch the volume cover the chapter is contained within
         cover_url = urljoin(self.api_url, "cover")
-        offset = 0
         params = {
             "manga[]": series_id,
             "limit": 100,
-            "offset": offset,
+            "offset": 0,
         }
 
-        covers_for_series: MangaDexResponse[list[MangaDexCover]] = self._get_content(cover_url, params)
-
-        current_result_count = len(covers_for_series["data"])
-        total_result_count = covers_for_series["total"]
+        mdex_response: MangaDexResponse[list[MangaDexCover]] = self._get_content(cover_url, params)
 
         # see if we need to keep asking for more pages...
-        while current_result_count < total_result_count:
-            offset += 100
-            params["offset"] = offset
-            mdex_response = self._get_content(cover_url, params)
+        covers_for_series: list[MangaDexCover] = self._combine_pages(
+            [mdex_response, *self._get_remaining_pages(cover_url, params, mdex_response["total"], parallel)]
+        )
 
-            covers_for_series["data"].extend(mdex_response["data"])
-            current_result_count += len(mdex_response["data"])
+        # Match chapter to volume cover, the first cover listed for a volume is used
+        cover_by_volume: dict[str, str] = {}
+        for cover in covers_for_series:
+            if cover["attributes"].get("volume"):
+                cover_by_volume.setdefault(cover["attributes"]["volume"], cover["attributes"]["fileName"])
 
-        # Match chapter to volume cover
         for issue in issues:
-            if issue["attributes"].get("volume"):
-                wanted_volume = issue["attributes"]["volume"]
-                for cover in covers_for_series["data"]:
-                    if cover["attributes"]["volume"] == wanted_volume:
-                        issue["attributes"]["image"] = urljoin(
-                            self.cover_url_base, f"{series_id}/{cover['attributes']['fileName']}"
-                        )
-                        break
+            file_name = cover_by_volume.get(issue["attributes"].get("volume"))
+            if file_name:
+                issue["attributes"]["image"] = urljoin(self.cover_url_base, f"{series_id}/{file_name}")
 
         return issues
 
-    def _map_comic_issue_to_metadata(self, issue: MangaDexChapter, series: MangaDexSeries) -> GenericMetadata:
-        md = GenericMetadata(
-            data_origin=MetadataOrigin(self.id, self.name),
-            issue_id=utils.xlate(issue["id"]),
-            series_id=utils.xlate(series["id"]),
-            issue=utils.xlate(IssueString(issue["attributes"]["chapter"]).as_string()),
+    def _get_series_context(self, series: MangaDexSeries) -> MangaDexSeriesContext:
+        # Only reuse the context if it was built from this very record, a refreshed series is a new record
+        cached = self._series_contexts.get(series["id"])
+        if cached is not None and cached[0] is series:
+            return cached[1]
+
+        sattrs = series["attributes"]
+        xlate_int = utils.xlate_int
+
+        context = MangaDexSeriesContext(
+            series_id=series["id"],
+            # TODO Language support?
+            series=utils.xlate(sattrs["title"]["en"]),
+            description=None,
+            genres=set(),
+            tags=set(),
+            format=None,
+            series_aliases={next(iter(alt_title.values())) for alt_title in sattrs.get("altTitles", ()) if alt_title},
+            maturity_rating=None,
+            publisher=None,
+            credits=[],
+            issue_count=None,
+            volume_count=None,
+            year=xlate_int(sattrs.get("year")),
+            # Can't point to an "issue" per se, so point to series
+            web_link=self._title_url_prefix + series["id"],
         )
-        # TODO Language support?
-        md.series = utils.xlate(series["attributes"]["title"]["en"])
-
-        md.manga = "Yes"
-
-        md.cover_image = issue["attributes"].get("image")
 
         # Check if series is ongoing to legitimise issue count OR use option setting
         # Having a lastChapter indicated completed or cancelled
-        if series["attributes"]["lastChapter"] or self.use_ongoing_issue_count:
-            md.issue_count = utils.xlate_int(series["attributes"]["lastChapter"])
-            md.volume_count = utils.xlate_int(series["attributes"]["lastVolume"])
+        last_chapter = sattrs["lastChapter"]
+        if last_chapter or self.use_ongoing_issue_count:
+            context["issue_count"], context["volume_count"] = xlate_int(last_chapter), xlate_int(sattrs["lastVolume"])
 
         # TODO Select language?
         # TODO Option to copy series desc or not?
-        if series["attributes"].get("description"):
-            md.description = next(iter(series["attributes"]["description"].values()), None)
+        description = sattrs.get("description")
+        if description:
+            context["description"] = next(iter(description.values()), None)
 
-        if series["attributes"].get("tags"):
+        series_tags = sattrs.get("tags")
+        if series_tags:
             # Tags holds genre, theme, content warning and format
-            genres = []
-            tags = []
-            format_type = None
-
-            for mdex_tags in series["attributes"]["tags"]:
-                if mdex_tags["attributes"]["group"] == "genre":
-                    genres.append(mdex_tags["attributes"]["name"]["en"])
-
-                if mdex_tags["attributes"]["group"] == "format":
-                    if mdex_tags["attributes"]["name"]["en"] in ["Web Comic", "Oneshot"]:
-                        format_type = mdex_tags["attributes"]["name"]["en"]
+            genres = context["genres"]
+            tags = context["tags"]
+
+            for mdex_tags in series_tags:
+                tattrs = mdex_tags["attributes"]
+                group = tattrs["group"]
+                name_en = tattrs["name"]["en"]
+
+                if group == "genre":
+                    genres.add(name_en)
+                elif group == "format":
+                    if name_en in format_tags:
+                        context["format"] = name_en
                     else:
-                        tags.append(mdex_tags["attributes"]["name"]["en"])
-
-                if mdex_tags["attributes"]["group"] in ["theme", "content"]:
-                    tags.append(mdex_tags["attributes"]["name"]["en"])
-
-            md.genres = set(genres)
-            md.tags = set(tags)
-            md.format = format_type
-
-        md.title = utils.xlate(issue["attributes"]["title"])
+                        tags.add(name_en)
+                elif group in tag_groups:
+                    tags.add(name_en)
 
-        for alt_title in series["attributes"].get("altTitles", set()):
-            md.series_aliases.add(next(iter(alt_title.values())))
-
-        md.language = utils.xlate(issue["attributes"].get("translatedLanguage"))
-
-        if series["attributes"].get("contentRating"):
-            md.maturity_rating = series["attributes"]["contentRating"].capitalize()
-
-        # Can't point to an "issue" per se, so point to series
-        md.web_link = urljoin(self.website, f"title/{series['id']}")
+        content_rating = sattrs.get("contentRating")
+        if content_rating:
+            context["maturity_rating"] = content_ratings.get(content_rating) or content_rating.capitalize()
 
         # Parse relationships
+        credits = context["credits"]
         for rel in series["relationships"]:
-            if rel["type"] == "author":
-                md.add_credit(rel["attributes"]["name"], "writer")
-            if rel["type"] == "artist":
-                md.add_credit(rel["attributes"]["name"], "artist")
+            rtype = rel["type"]
+            if rtype == "author":
+                credits.append((rel["attributes"]["name"], "writer"))
+            elif rtype == "artist":
+                credits.append((rel["attributes"]["name"], "artist"))
+            elif rtype == "scanlation_group":
+                rattrs = rel["attributes"]
+                if rattrs["official"]:
+                    context["publisher"] = rattrs["name"]
+
+        self._series_contexts.put(series["id"], (series, context))
+        return context
 
-            if rel["type"] == "scanlation_group" and rel["attributes"]["official"]:
-                md.publisher = rel["attributes"]["name"]
+    def _map_comic_issue_to_metadata(self, issue: MangaDexChapter, series: MangaDexSeries) -> GenericMetadata:
+        iattrs = issue["attributes"]
+        context = self._get_series_context(series)
+        xlate = utils.xlate
+
+        # Plain chapter numbers are already in the form IssueString gives, anything else is normalised by it
+        chapter = iattrs["chapter"]
+        if chapter and chapter.isascii() and chapter.isdigit() and chapter[0] != "0":
+            issue_number: str | None = chapter
+        else:
+            issue_number = xlate(IssueString(chapter).as_string())
+
+        # The sets are copied as the metadata may be altered after it is returned
+        md = GenericMetadata(
+            data_origin=MetadataOrigin(self.id, self.name),
+            issue_id=issue["id"],
+            series_id=context["series_id"],
+            issue=issue_number,
+            series=context["series"],
+            title=xlate(iattrs["title"]),
+            manga="Yes",
+            language=iattrs.get("translatedLanguage") or None,
+            volume=context["year"] if self.use_series_start_as_volume else utils.xlate_int(iattrs["volume"]),
+            issue_count=context["issue_count"],
+            volume_count=context["volume_count"],
+            description=context["description"],
+            genres=set(context["genres"]),
+            tags=set(context["tags"]),
+            format=context["format"],
+            series_aliases=set(context["series_aliases"]),
+            maturity_rating=context["maturity_rating"],
+            publisher=context["publisher"],
+        )
 
-        md.volume = utils.xlate_int(issue["attributes"]["volume"])
+        md.cover_image = iattrs.get("image")
+        md.web_link = context["web_link"]
 
-        if self.use_series_start_as_volume:
-            md.volume = utils.xlate_int(series["attributes"]["year"])
+        add_credit = md.add_credit
+        for name, role in context["credits"]:
+            add_credit(name, role)
 
-        if issue["attributes"].get("publishAt"):
-            publish_date = datetime.datetime.fromisoformat(issue["attributes"]["publishAt"])
-            md.day, md.month, md.year = utils.parse_date_str(publish_date.strftime("%Y-%m-%d"))
-        elif series["attributes"].get("year"):
-            md.year = utils.xlate_int(series["attributes"].get("year"))
+        if iattrs.get("publishAt"):
+            publish_date = datetime.datetime.fromisoformat(iattrs["publishAt"])
+            md.day, md.month, md.year = publish_date.day, publish_date.month, publish_date.year
+        elif context["year"]:
+            md.year = context["year"]
 
         return md